@@ -48,7 +48,32 @@ import mixlib
 
 
 # The data type used to keep track of open files
-FileRecord = collections.namedtuple("FileRecord", ("path", "stat", "container", "store", "button", "existed"))
+class FileRecord(object):
+	"""Record of an open file and the objects belonging to it."""
+	
+	__slots__ = ("path", "stat", "container", "store", "button", "existed", "inode")
+	
+	def __init__(self, path: str, stat: os.stat_result, container: mixlib.MixFile, store: Gtk.ListStore, button: Gtk.RadioButton, existed: bool):
+		"""Initialize the record."""
+		self.path      = path
+		self.stat      = stat
+		self.container = container
+		self.store     = store
+		self.button    = button
+		self.existed   = existed
+		self.inode     = (stat.st_dev, stat.st_ino)  # Key in Mixtool._open_inodes
+
+
+# Needed by Configuration on class creation
+def str2bool(value: str) -> bool:
+	"""Convert an INI file's representation of a boolean to bool.
+	
+	ValueError is raised if `value` is not recognized.
+	"""
+	try:
+		return configparser.RawConfigParser.BOOLEAN_STATES[value.lower()]
+	except KeyError:
+		raise ValueError("Not a boolean: {0!r}".format(value)) from None
 
 
 # A simple abstraction of Python's ConfigParser.
@@ -60,14 +85,33 @@ FileRecord = collections.namedtuple("FileRecord", ("path", "stat", "container",
 class Configuration(collections.abc.MutableMapping):
 	"""INI file based configuration manager"""
 	
-	__slots__ = ("_defaults", "_parser", "_section")
+	__slots__ = ("_defaults", "_parser", "_section", "_cache", "_saved")
 	
 	_key_chars = re.compile("[0-9_a-z]*", re.ASCII)
-	_types = frozenset((bool, int, float, str, bytes))
+	
+	# Functions to convert a stored value, by registered type
+	_getters = {
+		bool: str2bool,
+		int: int,
+		float: float,
+		str: lambda raw: parse.unquote(raw, errors="strict"),
+		bytes: parse.unquote_to_bytes
+	}
+	
+	# Functions to convert a value for storage, by registered type
+	_setters = {
+		bool: lambda value: "yes" if value else "no",
+		int: str,
+		float: str,
+		str: parse.quote,
+		bytes: parse.quote_from_bytes
+	}
 	
 	def __init__(self, product: str) -> None:
 		"""Initialize the configuration manager."""
 		self._defaults = {}
+		self._cache = {}
+		self._saved = None  # Fingerprint and contents of the last save
 		self._parser = configparser.RawConfigParser(
 			None, dict, False,
 			delimiters=("=",),
@@ -78,31 +122,32 @@ class Configuration(collections.abc.MutableMapping):
 			default_section=None,
 			interpolation=None
 		)
-		self._section = product
 		self._parser.add_section(product)
+		
+		# The section's options are accessed directly, bypassing
+		# the parser's lookup and name transformation on each access.
+		# Identifiers are restricted to what the parser would produce.
+		self._section = self._parser._sections[product]
 	
 	def __getitem__(self, identifier: str):
 		"""Return value of `identifier` or the registered default on errors.
 		
 		KeyError is raised if there is no such identifier.
 		"""
-		default = self._defaults[identifier]
-		if self._parser.has_option(self._section, identifier):
-			dtype = type(default)
+		try:
+			return self._cache[identifier]
+		except KeyError:
+			pass
+		
+		value = self._defaults[identifier]
+		raw = self._section.get(identifier)
+		if raw is not None:
 			try:
-				if dtype is bool:
-					return self._parser.getboolean(self._section, identifier, raw=True)
-				if dtype is int:
-					return self._parser.getint(self._section, identifier, raw=True)
-				if dtype is float:
-					return self._parser.getfloat(self._section, identifier, raw=True)
-				if dtype is str:
-					return parse.unquote(self._parser.get(self._section, identifier, raw=True), errors="strict")
-				if dtype is bytes:
-					return parse.unquote_to_bytes(self._parser.get(self._section, identifier, raw=True))
+				value = self._getters[type(value)](raw)
 			except ValueError:
-				self._parser.remove_option(self._section, identifier)
-		return default
+				del self._section[identifier]
+		self._cache[identifier] = value
+		return value
 	
 	def __setitem__(self, identifier: str, value) -> None:
 		"""Set `identifier` to `value`.
@@ -111,17 +156,10 @@ class Configuration(collections.abc.MutableMapping):
 		TypeError is raised if `value` does not match the registered type.
 		"""
 		dtype = type(self._defaults[identifier])
-		if dtype is bool and type(value) is bool:
-			self._parser.set(self._section, identifier, "yes" if value else "no")
-		elif dtype is int and type(value) is int\
-		  or dtype is float and type(value) is float:
-			self._parser.set(self._section, identifier, str(value))
-		elif dtype is str and type(value) is str:
-			self._parser.set(self._section, identifier, parse.quote(value))
-		elif dtype is bytes and type(value) is bytes:
-			self._parser.set(self._section, identifier, parse.quote_from_bytes(value))
-		else:
+		if type(value) is not dtype:
 			raise TypeError("Not matching registered type")
+		self._section[identifier] = self._setters[dtype](value)
+		self._cache[identifier] = value
 	
 	def __delitem__(self, identifier: str) -> None:
 		"""Remove customized value of `identifier`.
@@ -129,7 +167,8 @@ class Configuration(collections.abc.MutableMapping):
 		Nothing is done if the value was not customized,
 		but KeyError is raised if `identifier` was not registered."""
 		if identifier in self._defaults:
-			self._parser.remove_option(self._section, identifier)
+			self._section.pop(identifier, None)
+			self._cache.pop(identifier, None)
 		else:
 			raise KeyError(identifier)
 	
@@ -152,7 +191,8 @@ class Configuration(collections.abc.MutableMapping):
 	def clear(self) -> None:
 		"""Remove all customized values, reverting to the registered defaults."""
 		for identifier in self._defaults.keys():
-			self._parser.remove_option(self._section, identifier)
+			self._section.pop(identifier, None)
+		self._cache.clear()
 	
 	def register(self, identifier: str, default) -> None:
 		"""Register a setting and its default value.
@@ -165,6 +205,25 @@ class Configuration(collections.abc.MutableMapping):
 		
 		Supported types are bool, int, float, str, and bytes.
 		"""
+		self._check_registration(identifier, default)
+		self._defaults[identifier] = default
+	
+	def register_many(self, items) -> None:
+		"""Register settings from an iterable of (identifier, default) pairs.
+		
+		The same rules as for register() apply. If any of the pairs
+		is not valid, none of them will be registered.
+		"""
+		defaults = {}
+		for identifier, default in items:
+			self._check_registration(identifier, default)
+			if identifier in defaults:
+				raise ValueError("Identifier already registered")
+			defaults[identifier] = default
+		self._defaults.update(defaults)
+	
+	def _check_registration(self, identifier: str, default) -> None:
+		"""Raise an exception if `identifier` and `default` can not be registered."""
 		if type(identifier) is not str:
 			raise TypeError("Identifiers must be strings")
 		if not identifier:
@@ -173,9 +232,8 @@ class Configuration(collections.abc.MutableMapping):
 			raise ValueError("Identifier contains invalid characters")
 		if identifier in self._defaults:
 			raise ValueError("Identifier already registered")
-		if type(default) not in self._types:
+		if type(default) not in self._getters:
 			raise TypeError("Unsupported type")
-		self._defaults[identifier] = default
 	
 	def get_default(self, identifier: str):
 		"""Return the default value of `identifier`.
@@ -186,13 +244,54 @@ class Configuration(collections.abc.MutableMapping):
 	
 	def load(self, file: str) -> None:
 		"""Read and parse a configuration file."""
+		self._cache.clear()
 		with open(file, encoding="ascii") as config_stream:
 			self._parser.read_file(config_stream)
+			stat = os.fstat(config_stream.fileno())
+		# Remember what the file would look like when saved right away,
+		# so save() can skip writing if nothing changes.
+		self._saved = (stat.st_mtime_ns, stat.st_size, self._render())
 	
-	def save(self, file: str) -> None:
-		"""Save the configuration."""
-		with open(file, "w", encoding="ascii") as config_stream:
-			self._parser.write(config_stream, False)
+	def save(self, file: str) -> bool:
+		"""Save the configuration and return whether the file was written.
+		
+		The file is replaced atomically, so it is never left
+		half-written. If neither the file nor the configuration changed
+		since it was last loaded or saved, nothing is written.
+		"""
+		data = self._render()
+		
+		if self._saved is not None:
+			try:
+				stat = os.stat(file)
+			except OSError:
+				pass
+			else:
+				if self._saved == (stat.st_mtime_ns, stat.st_size, data):
+					return False
+		
+		temp_file = file + ".tmp"
+		try:
+			with open(temp_file, "wb") as config_stream:
+				config_stream.write(data)
+				config_stream.flush()
+				os.fsync(config_stream.fileno())
+			os.replace(temp_file, file)
+		except BaseException:
+			try:
+				os.remove(temp_file)
+			except OSError:
+				pass
+			raise
+		stat = os.stat(file)
+		self._saved = (stat.st_mtime_ns, stat.st_size, data)
+		return True
+	
+	def _render(self) -> bytes:
+		"""Return the configuration as it would be written to a file."""
+		config_buffer = io.StringIO()
+		self._parser.write(config_buffer, False)
+		return config_buffer.getvalue().encode("ascii")
 
 
 class Mixtool(Gtk.Application):
@@ -202,10 +301,20 @@ class Mixtool(Gtk.Application):
 	_simple_chars = re.compile("[-.\\w]*", re.ASCII)
 	_hex_digits = re.compile("[\\dA-Fa-f]*", re.ASCII)  # Check & ask on inserts
 	
-	# The GtkFileFilter used by open/save dialogs
-	_file_filter = Gtk.FileFilter()
-	_file_filter.set_name("MIX files")
-	_file_filter.add_pattern("*.[Mm][Ii][Xx]")
+	# Registered settings and their defaults,
+	# except for those depending on the environment
+	_settings_defaults = (
+		("version", ""),
+		("nowarn", 0),
+		("simplenames", True),
+		("insertlower", True),
+		("decrypt", True),
+		("backup", False),
+		("extracttolast", True),
+		("smalltools", False),
+		("nomotd", False),
+		("units", "iec")
+	)
 	
 	# Object initializer
 	def __init__(self) -> None:
@@ -220,8 +329,12 @@ class Mixtool(Gtk.Application):
 		# Initialize mandatory attributes
 		self._startup_complete = False
 		self._data_path_blocked = False
+		self._builder = None
+		self._window_title = None
+		self._status_text = None
 		self._motd = None
 		self._files = []
+		self._open_inodes = {}  # (st_dev, st_ino) → FileRecord
 	
 	# This is run when Gtk.Application initializes the first instance.
 	# It is not run on any remote controllers.
@@ -231,7 +344,8 @@ class Mixtool(Gtk.Application):
 		Gdk.Screen.get_default().set_resolution(96.0)
 		
 		# Load resource file
-		resource_file = os.sep.join((os.path.dirname(os.path.realpath(__file__)), "gui.gresource"))
+		resource_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "gui.gresource")
+		self._resource_file = resource_file
 		try:
 			resources = Gio.resource_load(resource_file)
 		except GLib.Error as problem:
@@ -249,46 +363,15 @@ class Mixtool(Gtk.Application):
 		except GLib.Error:
 			pass
 		
-		# Parse interface definitions
-		self._builder = Gtk.Builder()
-		try:
-			self._builder.add_from_resource("/com/bachsau/mixtool/main.glade")
-		except GLib.Error as problem:
-			print(problem.message, file=sys.stderr)
-			alert("Interface could not be set up.", "e", secondary="\n\n".join((
-				problem.message,
-				"The data file “{0}” might be damaged.".format(resource_file),
-				"Mixtool will quit."
-			)))
-			sys.exit(1)
-		self._builder.connect_signals({
-			"on_new_clicked": self.invoke_new_dialog,
-			"on_open_clicked": self.invoke_open_dialog,
-			"on_properties_clicked": self.invoke_properties_dialog,
-			"on_optimize_clicked": noop,
-			"on_insert_clicked": noop,
-			"on_delete_clicked": self.delete_selected_files,
-			"on_extract_clicked": self.invoke_extract_dialog,
-			"on_settings_clicked": self.invoke_settings_dialog,
-			"on_about_clicked": self.invoke_about_dialog,
-			"on_close_clicked": self.close_current_file,
-			"on_quit_clicked": self.close_window,
-			"on_version_changed": self.update_properties_dialog,
-			"on_defaults_clicked": self.restore_default_settings,
-			"on_donate_clicked": self.open_donation_website,
-			"on_selection_changed": self.handle_selection_change,
-			"on_key_pressed": self.handle_custom_keys
-		})
-		
 		# Determine platform-specific conditions
 		self.home_path = os.path.realpath(os.path.expanduser("~"))
 		if sys.platform.startswith("win"):
 			# Microsoft Windows
 			os_appdata = os.environ.get("APPDATA")
 			if os_appdata is None:
-				self.data_path = self.home_path + "\\AppData\\Roaming\\Bachsau\\Mixtool"
+				self.data_path = os.path.join(self.home_path, "AppData", "Roaming", "Bachsau", "Mixtool")
 			else:
-				self.data_path = os.path.realpath(os_appdata) + "\\Bachsau\\Mixtool"
+				self.data_path = os.path.join(os.path.abspath(os_appdata), "Bachsau", "Mixtool")
 			del os_appdata
 			self._reserved_filenames = frozenset((
 				"AUX", "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7",
@@ -298,32 +381,33 @@ class Mixtool(Gtk.Application):
 			self._reserved_filechars = re.compile("[\"*/:<>?\\\\|]|\\.$", re.ASCII)
 		elif sys.platform.startswith("darwin"):
 			# Apple macOS
-			self.data_path = self.home_path + "/Library/Application Support/com.bachsau.mixtool"
+			self.data_path = os.path.join(self.home_path, "Library", "Application Support", "com.bachsau.mixtool")
 			self._reserved_filenames = frozenset((".", ".."))
 			self._reserved_filechars = re.compile("[/]", re.ASCII)
 		else:
 			# Linux and others
 			os_appdata = os.environ.get("XDG_DATA_HOME")
 			if os_appdata is None:
-				self.data_path = self.home_path + "/.local/share/mixtool"
+				self.data_path = os.path.join(self.home_path, ".local", "share", "mixtool")
 			else:
-				self.data_path = os.path.realpath(os_appdata) + "/mixtool"
+				self.data_path = os.path.join(os.path.abspath(os_appdata), "mixtool")
 			del os_appdata
 			self._reserved_filenames = frozenset((".", ".."))
 			self._reserved_filechars = re.compile("[/]", re.ASCII)
 		
 		# Set path to configuration file
-		self.config_file = os.sep.join((self.data_path, "settings.ini"))
+		self.config_file = os.path.join(self.data_path, "settings.ini")
 		
 		# Create non-existent directories
 		if not os.path.isdir(self.data_path):
+			problem_description = None
 			try:
 				os.makedirs(self.data_path, 448)
+			except OSError as problem:
+				problem_description = "Failed to make directory “{0}”: {1}".format(problem.filename, problem.strerror)
 			except Exception as problem:
-				if isinstance(problem, OSError):
-					problem_description = "Failed to make directory “{0}”: {1}".format(problem.filename, problem.strerror)
-				else:
-					problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
+				problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
+			if problem_description is not None:
 				print(problem_description, file=sys.stderr)
 				alert("Profile directory could not be created.", "w", secondary="\n\n".join((
 						problem_description,
@@ -333,34 +417,28 @@ class Mixtool(Gtk.Application):
 		
 		# Set up the configuration manager
 		self.settings = Configuration("Mixtool")
-		self.settings.register("version", "")
-		self.settings.register("nowarn", 0)
-		self.settings.register("simplenames", True)
-		self.settings.register("insertlower", True)
-		self.settings.register("decrypt", True)
-		self.settings.register("backup", False)
-		self.settings.register("extracttolast", True)
-		self.settings.register("smalltools", False)
-		self.settings.register("nomotd", False)
-		self.settings.register("units", "iec")
-		self.settings.register("mixdir", self.home_path)
-		self.settings.register("extdir", self.home_path)
+		self.settings.register_many(self._settings_defaults)
+		self.settings.register_many((
+			("mixdir", self.home_path),
+			("extdir", self.home_path)
+		))
 		
 		if not self._data_path_blocked:
 			# Read configuration file
+			problem_description = None
 			try:
 				self.settings.load(self.config_file)
 			except FileNotFoundError:
 				pass
+			except OSError as problem:
+				problem_description = "Failed to open file “{0}”: {1}".format(problem.filename, problem.strerror)
+			except UnicodeError:
+				problem_description = "Error processing the file at “{0}”: {1}".format(self.config_file, "Contains non-ASCII characters")
+			except configparser.Error:
+				problem_description = "Error processing the file at “{0}”: {1}".format(self.config_file, "Contains incomprehensible structures")
 			except Exception as problem:
-				if isinstance(problem, OSError):
-					problem_description = "Failed to open file “{0}”: {1}".format(problem.filename, problem.strerror)
-				elif isinstance(problem, UnicodeError):
-					problem_description = "Error processing the file at “{0}”: {1}".format(self.config_file, "Contains non-ASCII characters")
-				elif isinstance(problem, configparser.Error):
-					problem_description = "Error processing the file at “{0}”: {1}".format(self.config_file, "Contains incomprehensible structures")
-				else:
-					problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
+				problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
+			if problem_description is not None:
 				print(problem_description, file=sys.stderr)
 				alert("Settings could not be restored.", "w", secondary="\n\n".join((
 						problem_description,
@@ -381,9 +459,96 @@ class Mixtool(Gtk.Application):
 					del self.settings["units"]
 			self.settings["version"] = __version__
 		
+		self._startup_complete = True
+	
+	def _ensure_builder(self) -> None:
+		"""Set up the user interface, unless it already exists."""
+		if self._builder is not None:
+			return
+		
+		# Parse interface definitions
+		builder = Gtk.Builder()
+		try:
+			builder.add_from_resource("/com/bachsau/mixtool/main.glade")
+		except GLib.Error as problem:
+			print(problem.message, file=sys.stderr)
+			alert("Interface could not be set up.", "e", secondary="\n\n".join((
+				problem.message,
+				"The data file “{0}” might be damaged.".format(self._resource_file),
+				"Mixtool will quit."
+			)))
+			sys.exit(1)
+		builder.connect_signals({
+			"on_new_clicked": self.invoke_new_dialog,
+			"on_open_clicked": self.invoke_open_dialog,
+			"on_properties_clicked": self.invoke_properties_dialog,
+			"on_optimize_clicked": noop,
+			"on_insert_clicked": noop,
+			"on_delete_clicked": self.delete_selected_files,
+			"on_extract_clicked": self.invoke_extract_dialog,
+			"on_settings_clicked": self.invoke_settings_dialog,
+			"on_about_clicked": self.invoke_about_dialog,
+			"on_close_clicked": self.close_current_file,
+			"on_quit_clicked": self.close_window,
+			"on_version_changed": self.update_properties_dialog,
+			"on_defaults_clicked": self.restore_default_settings,
+			"on_donate_clicked": self.open_donation_website,
+			"on_selection_changed": self.handle_selection_change,
+			"on_key_pressed": self.handle_custom_keys
+		})
+		
+		# Resolve frequently used objects once,
+		# so callbacks don't need to query the builder every time.
+		self._widgets = {}
+		for object_id in (
+			"MainWindow",
+			"Toolbar",
+			"Toolbar.Quit",
+			"Toolbar.Close",
+			"Toolbar.Properties",
+			"Toolbar.Delete",
+			"Toolbar.Extract",
+			"TabBar",
+			"ContentList",
+			"ContentSelector",
+			"DummyStore",
+			"StatusBar.Text",
+			"StatusBar.Version",
+			"StatusBar.Overhead",
+			"PropertiesDialog",
+			"PropertiesDialog.OK",
+			"Properties.Version",
+			"Properties.Checksum",
+			"Properties.Encrypt",
+			"SettingsDialog",
+			"SettingsDialog.OK",
+			"Settings.ExtractToSource",
+			"Settings.Units",
+			"Settings.ResetWarnings",
+			"VersionWarning",
+			"VersionWarning.OK",
+			"VersionWarning.Disable",
+			"DeletionWarning",
+			"DeletionWarning.Yes",
+			"DeletionWarning.Disable",
+			"AboutDialog"
+		):
+			self._widgets[object_id] = builder.get_object(object_id)
+		
+		# Checkboxes in the settings dialog and the settings they represent
+		self._settings_checkboxes = (
+			(builder.get_object("Settings.SimpleNames"), "simplenames"),
+			(builder.get_object("Settings.InsertLower"), "insertlower"),
+			(builder.get_object("Settings.Decrypt"), "decrypt"),
+			(builder.get_object("Settings.Backup"), "backup"),
+			(builder.get_object("Settings.ExtractToLast"), "extracttolast"),
+			(builder.get_object("Settings.SmallTools"), "smalltools"),
+			(builder.get_object("Settings.DisableMOTD"), "nomotd")
+		)
+		
 		# Prepare GUI
 		renderer = Gtk.CellRendererText(ellipsize=Pango.EllipsizeMode.END)
-		column = self._builder.get_object("ContentList.Name")
+		column = builder.get_object("ContentList.Name")
 		column.pack_start(renderer, False)
 		column.add_attribute(renderer, "text", 0)
 		for column_id, data in (
@@ -392,15 +557,22 @@ class Mixtool(Gtk.Application):
 			("ContentList.Spare", 3)
 		):
 			renderer = Gtk.CellRendererText(xalign=1.0, family="Monospace")
-			column = self._builder.get_object(column_id)
+			column = builder.get_object(column_id)
 			column.pack_start(renderer, False)
 			column.set_cell_data_func(renderer, self._render_formatted_size, data)
+		
+		# The GtkFileFilter used by open/save dialogs
+		self._file_filter = Gtk.FileFilter()
+		self._file_filter.set_name("MIX files")
+		self._file_filter.add_pattern("*.[Mm][Ii][Xx]")
+		
+		# Only now is the interface complete.
+		self._builder = builder
 		self._apply_settings()
-		self._startup_complete = True
 	
 	def _apply_settings(self) -> None:
 		"""Apply settings that should have an immediate effect on appearance."""
-		self._builder.get_object("Toolbar").set_style(
+		self._widgets["Toolbar"].set_style(
 			Gtk.ToolbarStyle.ICONS if self.settings["smalltools"] else Gtk.ToolbarStyle.BOTH
 		)
 		
@@ -424,17 +596,17 @@ class Mixtool(Gtk.Application):
 		Passing ... does not change a fields current value.
 		"""
 		if text is not ...:
-			label_widget = self._builder.get_object("StatusBar.Text")
 			if text is None:
 				if self.settings["nomotd"] or self._motd is None and not self._set_motd():
-					label_widget.set_text("Ready")
+					text = "Ready"
 				else:
-					label_widget.set_text(self._motd)
-			else:
-				label_widget.set_text(text)
+					text = self._motd
+			if text != self._status_text:
+				self._widgets["StatusBar.Text"].set_text(text)
+				self._status_text = text
 		
 		if version is not ...:
-			label_widget = self._builder.get_object("StatusBar.Version")
+			label_widget = self._widgets["StatusBar.Version"]
 			if version is None:
 				label_widget.set_text("–")
 				label_widget.set_has_tooltip(False)
@@ -443,7 +615,7 @@ class Mixtool(Gtk.Application):
 				label_widget.set_has_tooltip(True)
 		
 		if overhead is not ...:
-			label_widget = self._builder.get_object("StatusBar.Overhead")
+			label_widget = self._widgets["StatusBar.Overhead"]
 			if overhead is None:
 				label_widget.set_text("–")
 				label_widget.set_has_tooltip(False)
@@ -454,26 +626,26 @@ class Mixtool(Gtk.Application):
 				label_widget.set_text("No overhead")
 				label_widget.set_has_tooltip(True)
 	
+	def _set_title(self, title: str) -> None:
+		"""Set the title of the main window, unless it is already set."""
+		if title != self._window_title:
+			self._widgets["MainWindow"].set_title(title)
+			self._window_title = title
+	
 	def _set_motd(self) -> bool:
 		"""Set a new MOTD. Return True on success, else False."""
 		stream = None
+		problem_description = None
 		try:
 			stream = Gio.DataInputStream(
 				base_stream=Gio.resources_open_stream("/com/bachsau/mixtool/motd.txt", Gio.ResourceLookupFlags.NONE),
 				newline_type=Gio.DataStreamNewlineType.ANY
 			)
 			lines = [line[0] for line in iter(stream.read_line_utf8, (None, 0))]
+		except GLib.Error as problem:
+			problem_description = problem.message
 		except Exception as problem:
-			if isinstance(problem, GLib.Error):
-				problem_description = problem.message
-			else:
-				problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
-			print(problem_description, file=sys.stderr)
-			self.settings["nomotd"] = True
-			alert("MOTD could not be set.", "w", self.get_active_window(), secondary="\n\n".join((
-				problem.message,
-				"MOTD has been disabled."
-			)))
+			problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
 		else:
 			if lines:
 				self._motd = random.choice(lines)
@@ -481,25 +653,32 @@ class Mixtool(Gtk.Application):
 		finally:
 			if stream is not None:
 				stream.close()
+		if problem_description is not None:
+			print(problem_description, file=sys.stderr)
+			self.settings["nomotd"] = True
+			alert("MOTD could not be set.", "w", self.get_active_window(), secondary="\n\n".join((
+				problem_description,
+				"MOTD has been disabled."
+			)))
 		return False
 	
 	def invoke_properties_dialog(self, widget: Gtk.Widget) -> None:
 		"""Show a dialog to modify the current file’s properties."""
 		container = self._files[-1].container
 		verstr = container.get_version().name
-		version_chooser = self._builder.get_object("Properties.Version")
+		version_chooser = self._widgets["Properties.Version"]
 		version_chooser.set_active_id(verstr)
 		self.update_properties_dialog(version_chooser)
-		self._builder.get_object("PropertiesDialog.OK").grab_focus()
-		dialog = self._builder.get_object("PropertiesDialog")
+		self._widgets["PropertiesDialog.OK"].grab_focus()
+		dialog = self._widgets["PropertiesDialog"]
 		response = dialog.run()
 		dialog.hide()
 		
 		if response == Gtk.ResponseType.OK:
 			newver = version_chooser.get_active_id()
 			if newver != "TD":
-				container.has_checksum = self._builder.get_object("Properties.Checksum").get_active()
-				container.is_encrypted = self._builder.get_object("Properties.Encrypt").get_active()
+				container.has_checksum = self._widgets["Properties.Checksum"].get_active()
+				container.is_encrypted = self._widgets["Properties.Encrypt"].get_active()
 			if newver != verstr:
 				alert("Conversion is not implemented yet.", "e", widget.get_toplevel())
 				# FIXME: Catch errors
@@ -509,8 +688,8 @@ class Mixtool(Gtk.Application):
 		"""Update the properties dialog to reflect the chosen version."""
 		container = self._files[-1].container
 		decrypt = self.settings["decrypt"]
-		checkbox_encrypted = self._builder.get_object("Properties.Encrypt")
-		checkbox_checksum = self._builder.get_object("Properties.Checksum")
+		checkbox_encrypted = self._widgets["Properties.Encrypt"]
+		checkbox_checksum = self._widgets["Properties.Checksum"]
 		
 		if version_chooser.get_active_id() == "TD":
 			checkbox_checksum.set_sensitive(False)
@@ -527,58 +706,53 @@ class Mixtool(Gtk.Application):
 	
 	def invoke_settings_dialog(self, widget: Gtk.Widget) -> None:
 		"""Show a dialog with current settings and save any changes."""
-		# The updater returns a tuple of checkboxes to not repeat
-		# ourselfs when it comes to saving
-		checkboxes = self._update_settings_dialog(False)
-		self._builder.get_object("SettingsDialog.OK").grab_focus()
-		dialog = self._builder.get_object("SettingsDialog")
+		self._update_settings_dialog(False)
+		self._widgets["SettingsDialog.OK"].grab_focus()
+		dialog = self._widgets["SettingsDialog"]
 		response = dialog.run()
 		dialog.hide()
 		
 		if response == Gtk.ResponseType.OK:
-			# Save new settings
-			for checkbox, setting in checkboxes:
-				self.settings[setting] = checkbox.get_active()
-			self.settings["units"] = self._builder.get_object("Settings.Units").get_active_id()
-			if self._builder.get_object("Settings.ResetWarnings").get_active():
+			# Save settings that have been changed
+			changed = False
+			for checkbox, setting in self._settings_checkboxes:
+				value = checkbox.get_active()
+				if value != self.settings[setting]:
+					self.settings[setting] = value
+					changed = True
+			units = self._widgets["Settings.Units"].get_active_id()
+			if units != self.settings["units"]:
+				self.settings["units"] = units
+				changed = True
+			if self._widgets["Settings.ResetWarnings"].get_active():
 				del self.settings["nowarn"]
-			self._apply_settings()
+			if changed:
+				self._apply_settings()
 	
 	def restore_default_settings(self, widget: Gtk.Widget) -> None:
 		"""Set all widgets in the settings dialog to reflect the defaults."""
 		self._update_settings_dialog(True)
 	
-	def _update_settings_dialog(self, defaults: bool) -> tuple:
+	def _update_settings_dialog(self, defaults: bool) -> None:
 		"""Populate the settings dialog with the current or default settings."""
-		checkboxes = (
-			(self._builder.get_object("Settings.SimpleNames"), "simplenames"),
-			(self._builder.get_object("Settings.InsertLower"), "insertlower"),
-			(self._builder.get_object("Settings.Decrypt"), "decrypt"),
-			(self._builder.get_object("Settings.Backup"), "backup"),
-			(self._builder.get_object("Settings.ExtractToLast"), "extracttolast"),
-			(self._builder.get_object("Settings.SmallTools"), "smalltools"),
-			(self._builder.get_object("Settings.DisableMOTD"), "nomotd")
-		)
-		units_dropdown = self._builder.get_object("Settings.Units")
+		units_dropdown = self._widgets["Settings.Units"]
 		
 		# Push current settings to dialog
-		self._builder.get_object("Settings.ExtractToSource").set_active(True)
-		self._builder.get_object("Settings.ResetWarnings").set_active(defaults)
+		self._widgets["Settings.ExtractToSource"].set_active(True)
+		self._widgets["Settings.ResetWarnings"].set_active(defaults)
 		if defaults:
-			for checkbox, setting in checkboxes:
+			for checkbox, setting in self._settings_checkboxes:
 				checkbox.set_active(self.settings.get_default(setting))
 			units_dropdown.set_active_id(self.settings.get_default("units"))
 		else:
-			for checkbox, setting in checkboxes:
+			for checkbox, setting in self._settings_checkboxes:
 				checkbox.set_active(self.settings[setting])
 			units_dropdown.set_active_id(self.settings["units"])
-		
-		# Return the tuple of checkboxes to be used for saving
-		return checkboxes
 	
 	def _close_file(self, index: int) -> None:
 		"""Close the file specified by `index`."""
 		record = self._files.pop(index)
+		del self._open_inodes[record.inode]
 		record.container.finalize().close()
 		record.button.destroy()
 		
@@ -619,13 +793,14 @@ class Mixtool(Gtk.Application):
 		"""Finalize the application."""
 		try:
 			self._save_settings()
-			self._builder.get_object("MainWindow").destroy()
+			if self._builder is not None:
+				self._widgets["MainWindow"].destroy()
 		finally:
 			Gtk.Application.do_shutdown(self)
 	
 	def invoke_about_dialog(self, widget: Gtk.Widget) -> None:
 		"""Display a dialog with information on Mixtool."""
-		dialog = self._builder.get_object("AboutDialog")
+		dialog = self._widgets["AboutDialog"]
 		dialog.get_widget_for_response(Gtk.ResponseType.DELETE_EVENT).grab_focus()
 		dialog.run()
 		dialog.hide()
@@ -655,20 +830,20 @@ class Mixtool(Gtk.Application):
 	
 	def _get_selected_names(self):
 		"""Return a list of all names selected by the user."""
-		store, rows = self._builder.get_object("ContentSelector").get_selected_rows()
+		store, rows = self._widgets["ContentSelector"].get_selected_rows()
 		return [store[treepath][0] for treepath in rows]
 	
 	def delete_selected_files(self, widget: Gtk.Widget) -> None:
 		"""Delete selected files after showing an optional warning."""
 		nowarn = self.settings["nowarn"]
 		if not nowarn & 2:
-			self._builder.get_object("DeletionWarning.Yes").grab_focus()
-			dialog = self._builder.get_object("DeletionWarning")
+			self._widgets["DeletionWarning.Yes"].grab_focus()
+			dialog = self._widgets["DeletionWarning"]
 			response = dialog.run()
 			dialog.hide()
 			if response != Gtk.ResponseType.YES:
 				return
-			if self._builder.get_object("DeletionWarning.Disable").get_active():
+			if self._widgets["DeletionWarning.Disable"].get_active():
 				self.settings["nowarn"] = nowarn | 2
 		
 		self._check_make_backup()
@@ -761,11 +936,11 @@ class Mixtool(Gtk.Application):
 			)
 		else:
 			suggestion = names[0].replace(os.sep, "_")
-			if os.path.lexists(os.sep.join((browse_path, suggestion))):
+			if os.path.lexists(os.path.join(browse_path, suggestion)):
 				name_base, name_ext = splitext(suggestion)
 				suggestion = name_base + "1" + name_ext
 				i = 1
-				while os.path.lexists(os.sep.join((browse_path, suggestion))):
+				while os.path.lexists(os.path.join(browse_path, suggestion)):
 					i += 1
 					suggestion = name_base + str(i) + name_ext
 			dialog = Gtk.FileChooserDialog(
@@ -824,7 +999,7 @@ class Mixtool(Gtk.Application):
 		name_ext = ".mix"
 		suggestion = name_base + name_ext
 		i = 0
-		while os.path.lexists(os.sep.join((browse_path, suggestion))):
+		while os.path.lexists(os.path.join(browse_path, suggestion)):
 			i += 1
 			suggestion = name_base + str(i) + name_ext
 		version_chooser = Gtk.ComboBoxText()
@@ -893,15 +1068,17 @@ class Mixtool(Gtk.Application):
 	
 	def _reload_contents(self) -> None:
 		"""Refresh contents from container data."""
-		record = self._files[-1]
-		record.store.clear()
-		for content in record.container.get_contents():
-			record.store.append((
-				content.name,
-				content.size,
-				content.offset,
-				content.spare
-			))
+		store = self._files[-1].store
+		container = self._files[-1].container
+		
+		# Sorting is suspended while the store is refilled
+		sort_column_id, sort_order = store.get_sort_column_id()
+		store.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID, Gtk.SortType.ASCENDING)
+		store.clear()
+		for name, size, spare, offset in container.get_contents():
+			store.insert_with_valuesv(-1, (0, 1, 2, 3), (name, size, offset, spare))
+		if sort_column_id is not None:
+			store.set_sort_column_id(sort_column_id, sort_order)
 	
 	def _check_make_backup(self) -> bool:
 		"""Backup the current file if backups are enabled and none exists.
@@ -944,8 +1121,11 @@ class Mixtool(Gtk.Application):
 		
 		self.mark_busy()
 		try:
-			button = self._files[-1].button if self._files else None
+			# Open and parse all files first…
+			opened = []
+			opened_inodes = set()
 			for file in files:
+				# Resolve symlinks, so backups are made next to the real file
 				path = os.path.realpath(file.get_path())
 				stat = None
 				
@@ -958,13 +1138,9 @@ class Mixtool(Gtk.Application):
 						continue
 				else:
 					# File exists. Let's check if it's already open.
-					continue_ = False
-					for existing_record in self._files:
-						if os.path.samestat(existing_record.stat, stat):
-							errors.append((-1, path))
-							continue_ = True
-							break
-					if continue_:
+					inode = (stat.st_dev, stat.st_ino)
+					if inode in self._open_inodes or inode in opened_inodes:
+						errors.append((-1, path))
 						continue
 				
 				try:
@@ -987,44 +1163,44 @@ class Mixtool(Gtk.Application):
 				except OSError as problem:
 					errors.append((problem.errno, path))
 				else:
-					container = None
 					try:
 						container = mixlib.MixFile(stream, new)
 					except Exception:
 						# FIXME: Implement finer matching as mixlib's error handling evolves
 						traceback.print_exc(file=sys.stderr)
 						errors.append((-2, path))
+						stream.close()
 					else:
-						# Initialize a Gtk.ListStore
-						store = Gtk.ListStore(GObject.TYPE_STRING, GObject.TYPE_ULONG, GObject.TYPE_ULONG, GObject.TYPE_ULONG)
-						store.set_sort_column_id(0, Gtk.SortType.ASCENDING)
-						for content in container.get_contents():
-							store.append((
-								content.name,
-								content.size,
-								content.offset,
-								content.spare
-							))
-						
-						# Add a button
-						button = Gtk.RadioButton.new_with_label_from_widget(button, os.path.basename(path))
-						button.set_mode(False)
-						button.get_child().set_ellipsize(Pango.EllipsizeMode.END)
-						button.set_tooltip_text(path)
-						self._builder.get_object("TabBar").pack_start(button, False, True, 0)
-						button.show()
-						
-						# Create the file record
-						record = FileRecord(path, stat, container, store, button, existed)
-						self._files.append(record)
-						
-						# Connect the signal
-						button.connect("toggled", self.switch_file, record)
-					finally:
-						if container is None:
-							stream.close()
+						opened.append((path, stat, container, existed))
+						opened_inodes.add((stat.st_dev, stat.st_ino))
 			
-			if len(files) - len(errors):
+			# …then set up the interface for them in one go.
+			button = self._files[-1].button if self._files else None
+			for path, stat, container, existed in opened:
+				# Initialize a Gtk.ListStore
+				# and sort it once after it has been filled.
+				store = Gtk.ListStore(GObject.TYPE_STRING, GObject.TYPE_ULONG, GObject.TYPE_ULONG, GObject.TYPE_ULONG)
+				for name, size, spare, offset in container.get_contents():
+					store.insert_with_valuesv(-1, (0, 1, 2, 3), (name, size, offset, spare))
+				store.set_sort_column_id(0, Gtk.SortType.ASCENDING)
+				
+				# Add a button
+				button = Gtk.RadioButton.new_with_label_from_widget(button, os.path.basename(path))
+				button.set_mode(False)
+				button.get_child().set_ellipsize(Pango.EllipsizeMode.END)
+				button.set_tooltip_text(path)
+				self._widgets["TabBar"].pack_start(button, False, True, 0)
+				button.show()
+				
+				# Create the file record
+				record = FileRecord(path, stat, container, store, button, existed)
+				self._files.append(record)
+				self._open_inodes[record.inode] = record
+				
+				# Connect the signal
+				button.connect("toggled", self.switch_file, record)
+			
+			if opened:
 				self._update_gui()
 		finally:
 			self.unmark_busy()
@@ -1064,10 +1240,10 @@ class Mixtool(Gtk.Application):
 			self._files.append(record)
 			
 			title = button.get_label() + " – Mixtool"
-			self._builder.get_object("MainWindow").set_title(title)
+			self._set_title(title)
 			self._set_status(..., record.container.get_version(), record.container.get_overhead())
 			
-			content_list = self._builder.get_object("ContentList")
+			content_list = self._widgets["ContentList"]
 			content_list.set_model(record.store)
 			content_list.grab_focus()
 	
@@ -1075,32 +1251,32 @@ class Mixtool(Gtk.Application):
 		"""Enable or disable GUI elements based on current state."""
 		if self._files:
 			# Switch to Close button and enable ContentList
-			self._builder.get_object("Toolbar.Quit").hide()
-			self._builder.get_object("Toolbar.Close").show()
-			self._builder.get_object("Toolbar.Properties").set_sensitive(True)
-			self._builder.get_object("ContentList").set_sensitive(True)
+			self._widgets["Toolbar.Quit"].hide()
+			self._widgets["Toolbar.Close"].show()
+			self._widgets["Toolbar.Properties"].set_sensitive(True)
+			self._widgets["ContentList"].set_sensitive(True)
 			
 			# Switch to last open file
 			button = self._files[-1].button
 			button.toggled() if button.get_active() else button.set_active(True)
 		else:
 			# Switch to Quit button and disable ContentList
-			self._builder.get_object("Toolbar.Close").hide()
-			self._builder.get_object("Toolbar.Quit").show()
-			self._builder.get_object("Toolbar.Properties").set_sensitive(False)
-			self._builder.get_object("ContentList").set_sensitive(False)
+			self._widgets["Toolbar.Close"].hide()
+			self._widgets["Toolbar.Quit"].show()
+			self._widgets["Toolbar.Properties"].set_sensitive(False)
+			self._widgets["ContentList"].set_sensitive(False)
 			
 			# Reverse what self.switch_file() does
-			self._builder.get_object("MainWindow").set_title("Mixtool")
-			dummy_store = self._builder.get_object("DummyStore")
-			self._builder.get_object("ContentList").set_model(dummy_store)
+			self._set_title("Mixtool")
+			dummy_store = self._widgets["DummyStore"]
+			self._widgets["ContentList"].set_model(dummy_store)
 			self._set_status(None, None, None)
 		
 		# Display tab bar only when two ore more files are open
 		if len(self._files) < 2:
-			self._builder.get_object("TabBar").hide()
+			self._widgets["TabBar"].hide()
 		else:
-			self._builder.get_object("TabBar").show()
+			self._widgets["TabBar"].show()
 	
 	def handle_selection_change(self, selector: Gtk.TreeSelection) -> None:
 		"""Toggle button sensitivity based on the current selection."""
@@ -1118,8 +1294,8 @@ class Mixtool(Gtk.Application):
 		else:
 			valid = False
 		
-		self._builder.get_object("Toolbar.Delete").set_sensitive(valid)
-		self._builder.get_object("Toolbar.Extract").set_sensitive(valid)
+		self._widgets["Toolbar.Delete"].set_sensitive(valid)
+		self._widgets["Toolbar.Extract"].set_sensitive(valid)
 	
 	def handle_custom_keys(self, widget: Gtk.Widget, evkey: Gdk.EventKey) -> bool:
 		"""React to pressing delete on the content list."""
@@ -1142,19 +1318,20 @@ class Mixtool(Gtk.Application):
 				"Please report a bug if you are not using a development version."
 			)
 			sys.exit(1)
+		self._ensure_builder()
 		window = self.get_active_window()
 		if window is None:
-			window = self._builder.get_object("MainWindow")
+			window = self._widgets["MainWindow"]
 			self.add_window(window)
 			window.show()
 			
 			nowarn = self.settings["nowarn"]
 			if not nowarn & 1:
-				self._builder.get_object("VersionWarning.OK").grab_focus()
-				dialog = self._builder.get_object("VersionWarning")
+				self._widgets["VersionWarning.OK"].grab_focus()
+				dialog = self._widgets["VersionWarning"]
 				dialog.run()
 				dialog.hide()
-				if self._builder.get_object("VersionWarning.Disable").get_active():
+				if self._widgets["VersionWarning.Disable"].get_active():
 					self.settings["nowarn"] = nowarn | 1
 		else:
 			window.present()
@@ -1171,21 +1348,23 @@ class Mixtool(Gtk.Application):
 		"""Save configuration to disk."""
 		if not self._data_path_blocked:
 			try:
-				self.settings.save(self.config_file)
+				written = self.settings.save(self.config_file)
+			except OSError as problem:
+				problem_description = "Failed to open file “{0}”: {1}".format(problem.filename, problem.strerror)
 			except Exception as problem:
-				if isinstance(problem, OSError):
-					problem_description = "Failed to open file “{0}”: {1}".format(problem.filename, problem.strerror)
-				else:
-					problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
-				print(problem_description, file=sys.stderr)
-				alert("Settings could not be saved.", "w", self.get_active_window(), secondary="\n\n".join((
-						problem_description,
-						"Changes to your settings will be discarded when Mixtool quits."
-				)))
-				self._data_path_blocked = True
+				problem_description = "Unexpected “{0}”: {1}".format(type(problem).__name__, str(problem))
 			else:
-				print("Saved configuration file.", file=sys.stderr)
+				if written:
+					print("Saved configuration file.", file=sys.stderr)
+				else:
+					print("Settings unchanged, not saved.", file=sys.stderr)
 				return True
+			print(problem_description, file=sys.stderr)
+			alert("Settings could not be saved.", "w", self.get_active_window(), secondary="\n\n".join((
+					problem_description,
+					"Changes to your settings will be discarded when Mixtool quits."
+			)))
+			self._data_path_blocked = True
 		return False
 
 
@@ -1213,15 +1392,43 @@ def main() -> int:
 	application = Mixtool()
 	
 	# Start GUI
-	# Since GTK+ does not support KeyboardInterrupt, reset SIGINT to default.
-	# TODO: Build something with `GLib.unix_signal_add()`
-	signal.signal(signal.SIGINT, signal.SIG_DFL)
-	status = application.run(sys.argv)
+	# Since GTK+ does not support KeyboardInterrupt, let the main loop
+	# handle SIGINT by quitting the application where GLib supports it.
+	# Elsewhere reset SIGINT to default.
+	if hasattr(GLib, "unix_signal_add"):
+		def handle_sigint() -> bool:
+			# Quit cleanly, but let a second SIGINT terminate immediately,
+			# as quitting does not end a dialog that is currently running.
+			signal.signal(signal.SIGINT, signal.SIG_DFL)
+			application.quit()
+			return GLib.SOURCE_REMOVE
+		GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGINT, handle_sigint)
+	else:
+		signal.signal(signal.SIGINT, signal.SIG_DFL)
+	profile_file = os.environ.get("MIXTOOL_PROFILE")
+	if profile_file:
+		# Profile the whole run and write the stats to the given file
+		import cProfile
+		profiler = cProfile.Profile()
+		try:
+			status = profiler.runcall(application.run, sys.argv)
+		finally:
+			profiler.dump_stats(profile_file)
+	else:
+		status = application.run(sys.argv)
 	print("GTK+ returned.", file=sys.stderr)
 	
 	return status
 
 
+# Message types, titles and icons used by alert(), by severity
+_ALERT_SEVERITIES = {
+	"i": (Gtk.MessageType.INFO, "Notice", "dialog-info"),
+	"w": (Gtk.MessageType.WARNING, "Warning", "dialog-warning"),
+	"e": (Gtk.MessageType.ERROR, "Error", "dialog-error")
+}
+
+
 # A simple, instance-independent messagebox
 def alert(text, severity: str = "i", parent: Gtk.Window = None, *, secondary=None, markup: int = 0) -> None:
 	"""Display a dialog box containing `text` and an OK button.
@@ -1234,20 +1441,10 @@ def alert(text, severity: str = "i", parent: Gtk.Window = None, *, secondary=Non
 	`secondary` can be used to display additional text. The primary text
 	will appear bolder in that case.
 	"""
-	if severity == "i":
-		message_type = Gtk.MessageType.INFO
-		title = "Notice"
-		icon = "dialog-info"
-	elif severity == "w":
-		message_type = Gtk.MessageType.WARNING
-		title = "Warning"
-		icon = "dialog-warning"
-	elif severity == "e":
-		message_type = Gtk.MessageType.ERROR
-		title = "Error"
-		icon = "dialog-error"
-	else:
-		raise ValueError("Invalid severity level")
+	try:
+		message_type, title, icon = _ALERT_SEVERITIES[severity]
+	except KeyError:
+		raise ValueError("Invalid severity level") from None
 	
 	if parent is None:
 		position = Gtk.WindowPosition.CENTER
@@ -1279,6 +1476,13 @@ def alert(text, severity: str = "i", parent: Gtk.Window = None, *, secondary=Non
 	dialog.destroy()
 
 
+# Button sets and their positive response used by ask(), by identifier
+_ASK_BUTTONS = {
+	"yn": (Gtk.ButtonsType.YES_NO, Gtk.ResponseType.YES),
+	"oc": (Gtk.ButtonsType.OK_CANCEL, Gtk.ResponseType.OK)
+}
+
+
 # Messageboxes for when the user has a choice
 def ask(text, buttons: str = "yn", parent: Gtk.Window = None, *, secondary=None, markup: int = 0) -> bool:
 	"""Display a dialog box containing `text` and two buttons.
@@ -1291,14 +1495,10 @@ def ask(text, buttons: str = "yn", parent: Gtk.Window = None, *, secondary=None,
 	`secondary` can be used to display additional text. The primary text
 	will appear bolder in that case.
 	"""
-	if buttons == "yn":
-		buttons_type = Gtk.ButtonsType.YES_NO
-		positive_response = Gtk.ResponseType.YES
-	elif buttons == "oc":
-		buttons_type = Gtk.ButtonsType.OK_CANCEL
-		positive_response = Gtk.ResponseType.OK
-	else:
-		raise ValueError("Invalid buttons")
+	try:
+		buttons_type, positive_response = _ASK_BUTTONS[buttons]
+	except KeyError:
+		raise ValueError("Invalid buttons") from None
 	
 	if parent is None:
 		position = Gtk.WindowPosition.CENTER
@@ -1342,4 +1542,5 @@ def noop(*args) -> None:
 
 
 # Run the application
-sys.exit(main())
+if __name__ == "__main__":
+	sys.exit(main())
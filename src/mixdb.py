@@ -62,7 +62,7 @@ class NamesDB(object):
 	
 	def __init__(self, data_path: str):
 		"""Create or open the database file."""
-		dbfile = os.sep.join((data_path, "names.db"))
+		dbfile = os.path.join(data_path, "names.db")
 		# SQLite:
 		# 'keyword'    A keyword in single quotes is a string literal.
 		# "keyword"    A keyword in double-quotes is an identifier.
@@ -71,31 +71,48 @@ class NamesDB(object):
 			if attempt:
 				bakfile = dbfile + ".bak"
 				# No error handling here. It fails on second attempt.
+				# The write-ahead log goes with the database file, so its
+				# commits are kept in the backup and not applied to the new file.
 				if not os.path.exists(bakfile):
 					os.rename(dbfile, bakfile)
+					if os.path.exists(dbfile + "-wal"):
+						os.replace(dbfile + "-wal", bakfile + "-wal")
 				else:
 					os.remove(dbfile)
+					if os.path.exists(dbfile + "-wal"):
+						os.remove(dbfile + "-wal")
+			self._db = SQLiteDB(dbfile, isolation_level=None, check_same_thread=False)
 			try:
-				self._db = SQLiteDB(dbfile, isolation_level=None, check_same_thread=False)
+				self._db.query.execute("PRAGMA locking_mode = EXCLUSIVE;")
+				# In exclusive locking mode, WAL needs no shared memory file.
+				# NORMAL sync is still crash-safe in WAL mode.
+				self._db.query.execute("PRAGMA journal_mode = WAL;")
+				self._db.query.execute("PRAGMA synchronous = NORMAL;")
+				self._db.query.execute("PRAGMA mmap_size = 268435456;")  # 256 MiB
+				self._db.query.execute("PRAGMA cache_size = -16384;")  # 16 MiB
+				self._db.query.execute("PRAGMA temp_store = MEMORY;")
+				self._db.query.execute("PRAGMA trusted_schema = OFF;")
+				self._db.query.execute("PRAGMA quick_check;")
+				if self._db.query.fetchone()[0] != "ok":
+					raise sqlite3.DatabaseError("database disk image is malformed")
+				self._db.query.execute("SELECT COUNT(*) FROM \"sqlite_master\" WHERE \"name\" NOT GLOB 'sqlite_*'")
 			except sqlite3.OperationalError:
+				# Locked or inaccessible, but not known to be damaged
+				self._db.close()
+				raise
+			except sqlite3.DatabaseError:
+				self._db.close()
 				if attempt:
 					raise
-				continue  # Something's foul. Discard db and start over.
+				continue  # Database is damaged. Discard it and start over.
 			else:
-				self._db.query.execute("PRAGMA locking_mode = EXCLUSIVE;")
-				self._db.query.execute("PRAGMA journal_mode = TRUNCATE;")
-				self._db.query.execute("PRAGMA synchronous = FULL;")
-				try:
-					self._db.query.execute("SELECT COUNT(*) FROM \"sqlite_master\" WHERE \"name\" NOT GLOB 'sqlite_*'")
-				except sqlite3.OperationalError:
-					if attempt:
-						raise
-					continue  # Something's foul. Discard db and start over.
+				if self._db.query.fetchone()[0]:
+					# TODO: Check meta table
+					pass
 				else:
-					if self._db.query.fetchone()[0]:
-						# TODO: Check meta table
-						pass
-					else:
+					# Create the schema in a single transaction
+					self._db.query.execute("BEGIN;")
+					try:
 						self._db.query.execute("CREATE TABLE \"meta\" (\"property\" CHAR PRIMARY KEY NOT NULL, \"value\" CHAR NOT NULL) WITHOUT ROWID;")
 						self._db.query.execute("CREATE TABLE \"names_lo\" (\"key\" INT PRIMARY KEY NOT NULL, \"name\" CHAR NOT NULL) WITHOUT ROWID;")
 						self._db.query.execute("CREATE TABLE \"names_hi\" (\"key\" INT PRIMARY KEY NOT NULL, \"name\" CHAR NOT NULL) WITHOUT ROWID;")
@@ -105,26 +122,61 @@ class NamesDB(object):
 							("purpose", "names"),
 							("schema", "0")
 						))
+					except BaseException:
+						self._db.query.execute("ROLLBACK;")
+						raise
+					else:
+						self._db.query.execute("COMMIT;")
 			break
 	
-	def submit(version: int, names):
-		pass
+	def submit(self, version: int, names) -> None:
+		"""Store names for MIX `version` from an iterable of (key, name) pairs.
+		
+		All pairs are written in a single transaction.
+		"""
+		table = "names_lo" if version < 2 else "names_hi"
+		self._db.query.execute("BEGIN IMMEDIATE;")
+		try:
+			self._db.query.executemany("INSERT OR REPLACE INTO \"{0}\" VALUES (?, ?);".format(table), names)
+		except BaseException:
+			self._db.query.execute("ROLLBACK;")
+			raise
+		else:
+			self._db.query.execute("COMMIT;")
 	
-	def retrieve(version: int, keys):
-		pass
+	def retrieve(self, version: int, keys) -> dict:
+		"""Return a dictionary mapping each of `keys` to its name for MIX `version`.
+		
+		Keys without a known name are left out.
+		"""
+		table = "names_lo" if version < 2 else "names_hi"
+		query = self._db.query
+		# Keys are matched in one join instead of one query per key.
+		query.execute("CREATE TEMP TABLE IF NOT EXISTS \"lookup\" (\"key\" INT PRIMARY KEY NOT NULL) WITHOUT ROWID;")
+		query.execute("BEGIN;")
+		try:
+			query.executemany("INSERT OR IGNORE INTO \"lookup\" VALUES (?);", ((key,) for key in keys))
+			query.execute("SELECT \"{0}\".\"key\", \"{0}\".\"name\" FROM \"lookup\" JOIN \"{0}\" USING (\"key\");".format(table))
+			names = dict(query.fetchall())
+			query.execute("DELETE FROM \"lookup\";")
+		except BaseException:
+			query.execute("ROLLBACK;")
+			raise
+		else:
+			query.execute("COMMIT;")
+		return names
 	
 	# To get instid for comparison
-	def query_instid() -> uuid.UUID:
+	def query_instid(self) -> uuid.UUID:
 		# Moved here from __main__.py
 		# (needs rework)
-		try:
-			inst_id = uuid.UUID(int=self.settings["instid"])
-		except ValueError:
-			inst_id = None
-		if inst_id is not None\
-		and inst_id.variant == uuid.RFC_4122\
-		and inst_id.version == 4:
-			self.inst_id = inst_id
+		inst_id = self.settings["instid"]
+		# Test for a random RFC 4122 UUID on the integer's bits,
+		# without constructing a UUID object first.
+		if 0 <= inst_id < 1 << 128\
+		and inst_id >> 62 & 3 == 2\
+		and inst_id >> 76 & 15 == 4:
+			self.inst_id = uuid.UUID(int=inst_id)
 		else:
 			inst_id = uuid.uuid4()
 			self.settings["instid"] = inst_id.int
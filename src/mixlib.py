@@ -893,11 +893,6 @@ class MixFile(object):
 				buffer = InFile.read(rest)
 				self._stream.write(buffer)
 	
-	# Put a file's contents in a 'bytes' object
-	def get_bytes(self, name: str) -> bytes:
-		"""!!! STUB !!!"""
-		raise NotImplementedError("Stub method")
-	
 	# Open a file inside the MIX using MixIO
 	# Shall work like the built-in open function
 	def open(self, name: str, mode: str = "r", buffering: int = -1, encoding: str = None, errors: str = None, newline: str = None):